@@ -0,0 +1,67 @@
+"""Compare hit and miss latency of the lookup paths of `Database`.
+
+`get` with try/except is the path that existed before `get(default=)`, `exists` and
+`exists_many` were added, so it serves as the "before" baseline.
+
+    python benchmarks/bench_get_miss.py --n 100000
+"""
+import argparse
+import tempfile
+import timeit
+
+from lmdb_python import Database, lmdb_c
+
+
+def get_try_except(db: Database, key: bytes):
+    try:
+        return db.get(key)
+    except lmdb_c.LmdbException:
+        return None
+
+
+def get_default(db: Database, key: bytes):
+    return db.get(key, None)
+
+
+def exists(db: Database, key: bytes):
+    return db.exists(key)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as path:
+        db = Database(path, map_size=1024 * 1024 * 1024)
+        hit_keys = [f"key_{i}".encode() for i in range(args.n)]
+        miss_keys = [f"missing_{i}".encode() for i in range(args.n)]
+        db.put_batch((k, b"value") for k in hit_keys)
+
+        print(f"{'method':<16}{'hit (us/op)':>14}{'miss (us/op)':>14}")
+        for fn in (get_try_except, get_default, exists):
+            row = []
+            for keys in (hit_keys, miss_keys):
+                t = min(
+                    timeit.repeat(
+                        lambda: [fn(db, k) for k in keys], number=1, repeat=args.repeat
+                    )
+                )
+                row.append(t / len(keys) * 1e6)
+            print(f"{fn.__name__:<16}{row[0]:>14.3f}{row[1]:>14.3f}")
+
+        # one transaction for the whole batch
+        row = []
+        for keys in (hit_keys, miss_keys):
+            t = min(
+                timeit.repeat(
+                    lambda: db.exists_many(keys), number=1, repeat=args.repeat
+                )
+            )
+            row.append(t / len(keys) * 1e6)
+        print(f"{'exists_many':<16}{row[0]:>14.3f}{row[1]:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+import json
+from typing import Any, Generator, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .core import Database
+from .lmdb_c import _MISSING, MDB_NOTFOUND, LmdbDatabase, LmdbException, LmdbTransaction
+from .types import LmdbEnvFlags
+
+__all__ = ["ArrayDatabase"]
+
+_META_DB_NAME = "__array_meta__"
+
+
+# records are stored by a Database in the named sub-database `name` as raw array
+# bytes, so there is no (de)serialization. dtype and shape are stored once per table
+# in a metadata sub-database.
+class ArrayDatabase:
+    def __init__(
+        self,
+        path: str,
+        name: str = "arrays",
+        dtype: Optional[np.dtype] = None,
+        shape: Optional[Tuple[int, ...]] = None,
+        map_size: int = 10 * 1024 * 1024,  # 10MB
+        max_readers: int = 126,
+        max_dbs: int = 0,
+        flags: Optional[LmdbEnvFlags] = None,
+    ):
+        try:
+            # one more sub-database for the metadata
+            db = Database(path, map_size, max_readers, max_dbs + 1, flags, name=name)
+        except LmdbException as e:
+            # the table does not exist in a read-only environment
+            if e.rc != MDB_NOTFOUND:
+                raise
+            raise ValueError(
+                f"Table {name!r} does not exist. "
+                "dtype and shape are required to create it"
+            ) from None
+        self._open_table(db, dtype, shape)
+
+    def __getstate__(self) -> Database:
+        return self.db
+
+    def __setstate__(self, state: Database):
+        self._open_table(state, None, None)
+
+    def _open_table(
+        self, db: Database, dtype: Optional[np.dtype], shape: Optional[Tuple[int, ...]]
+    ) -> None:
+        self.db = db
+        self.env = db.env
+        self.name = db.name
+        read_only = self.env.get_flags().read_only
+        with LmdbTransaction(self.env, read_only=read_only) as txn:
+            try:
+                meta_dbi = LmdbDatabase(txn, name=_META_DB_NAME, create=not read_only)
+                meta = meta_dbi.get(self.name.encode(), txn, None)
+            except LmdbException as e:
+                # a read-only environment without any metadata
+                if e.rc != MDB_NOTFOUND:
+                    raise
+                meta = None
+            if meta is None:
+                if dtype is None or shape is None:
+                    raise ValueError(
+                        f"Table {self.name!r} does not exist. "
+                        "dtype and shape are required to create it"
+                    )
+                if read_only:
+                    raise ValueError(
+                        f"Table {self.name!r} does not exist. "
+                        "It cannot be created in a read-only environment"
+                    )
+                dtype = np.dtype(dtype)
+                if dtype.hasobject:
+                    raise ValueError("Object dtypes cannot be stored as raw bytes")
+                shape = tuple(shape)
+                meta = json.dumps(dict(dtype=dtype.str, shape=shape)).encode()
+                meta_dbi.put(self.name.encode(), meta, txn)
+            else:
+                meta = json.loads(meta)
+                stored_dtype = np.dtype(meta["dtype"])
+                stored_shape = tuple(meta["shape"])
+                if dtype is not None and np.dtype(dtype) != stored_dtype:
+                    raise ValueError(
+                        f"Table {self.name!r} stores dtype {stored_dtype}, "
+                        f"got {np.dtype(dtype)}"
+                    )
+                if shape is not None and tuple(shape) != stored_shape:
+                    raise ValueError(
+                        f"Table {self.name!r} stores shape {stored_shape}, "
+                        f"got {tuple(shape)}"
+                    )
+                dtype, shape = stored_dtype, stored_shape
+        self.dtype = dtype
+        self.shape = shape
+
+    # only make the array contiguous. casting would silently change the stored data
+    def _to_buffer(self, array: np.ndarray) -> np.ndarray:
+        array = np.asarray(array)
+        if array.dtype != self.dtype:
+            raise ValueError(f"Expected dtype {self.dtype}, got {array.dtype}")
+        if array.shape != self.shape:
+            raise ValueError(f"Expected shape {self.shape}, got {array.shape}")
+        return np.ascontiguousarray(array)
+
+    def _from_buffer(self, buffer) -> np.ndarray:
+        return np.frombuffer(buffer, dtype=self.dtype).reshape(self.shape)
+
+    def _get_view(self, key: bytes, txn: LmdbTransaction, default: Any) -> Any:
+        if default is _MISSING:
+            return self._from_buffer(self.db.dbi.get_view(key, txn))
+        view = self.db.dbi.get_view(key, txn, None)
+        return default if view is None else self._from_buffer(view)
+
+    # with txn, return a read-only view into the map. it is only valid until txn ends
+    def get(
+        self,
+        key: bytes,
+        default: Any = _MISSING,
+        *,
+        txn: Optional[LmdbTransaction] = None,
+    ) -> Any:
+        if txn is not None:
+            return self._get_view(key, txn, default)
+        with LmdbTransaction(self.env, read_only=True) as txn:
+            array = self._get_view(key, txn, default)
+            return array if array is default else array.copy()
+
+    def exists(self, key: bytes) -> bool:
+        return self.db.exists(key)
+
+    def __contains__(self, key: bytes) -> bool:
+        return self.db.exists(key)
+
+    def put(self, key: bytes, value: np.ndarray) -> None:
+        self.db.put(key, self._to_buffer(value))
+
+    def delete(self, key: bytes) -> None:
+        self.db.delete(key)
+
+    def get_batch(self, keys: Iterable[bytes]) -> Generator[np.ndarray, None, None]:
+        with LmdbTransaction(self.env, read_only=True) as txn:
+            for k in keys:
+                yield self._from_buffer(self.db.dbi.get_view(k, txn)).copy()
+
+    def get_stack(
+        self, keys: Sequence[bytes], out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        if out is None:
+            out = np.empty((len(keys), *self.shape), dtype=self.dtype)
+        elif out.shape != (len(keys), *self.shape) or out.dtype != self.dtype:
+            raise ValueError(
+                f"out must have shape {(len(keys), *self.shape)} and dtype {self.dtype}"
+            )
+        with LmdbTransaction(self.env, read_only=True) as txn:
+            for i, k in enumerate(keys):
+                out[i] = self._from_buffer(self.db.dbi.get_view(k, txn))
+        return out
+
+    def exists_many(self, keys: Iterable[bytes]) -> List[bool]:
+        return self.db.exists_many(keys)
+
+    def put_batch(self, kv_pairs: Iterable[Tuple[bytes, np.ndarray]]) -> None:
+        self.db.put_batch((k, self._to_buffer(v)) for k, v in kv_pairs)
+
+    def delete_batch(self, keys: Iterable[bytes]) -> None:
+        self.db.delete_batch(keys)
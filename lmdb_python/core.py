@@ -1,11 +1,59 @@
 import os
-from typing import Generator, Iterable, Optional, Tuple
+import threading
+from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, Tuple
 
-from .lmdb_c import LmdbDatabase, LmdbEnvironment, LmdbTransaction
+from .lmdb_c import (
+    _MISSING,
+    MDB_NOTFOUND,
+    LmdbCursor,
+    LmdbDatabase,
+    LmdbEnvironment,
+    LmdbException,
+    LmdbTransaction,
+)
 from .types import LmdbEnvFlags
 
 __all__ = ["Database"]
 
+_WARM_UP_CHUNK_SIZE = 4 * 1024 * 1024  # 4MB
+# index sub-databases are named in the main database, so prefix them to avoid clashes
+_INDEX_DB_PREFIX = "__index__."
+
+# maps a value to its index key. return None to leave the record out of the index.
+# it is pickled together with Database, so it must be a module-level function
+_IndexFn = Callable[[bytes], Optional[bytes]]
+_DatabaseState = Tuple[LmdbEnvironment, Dict[str, _IndexFn], Optional[str]]
+
+
+def _read_into_page_cache(
+    data_path: str,
+    size: int,
+    chunk_size: int,
+    progress: Optional[Callable[[int, int], None]],
+) -> None:
+    # LMDB reads through a shared mmap, so reading the file populates the page cache.
+    # open our own handle: on Windows, LmdbEnvironment.get_fd() creates a new CRT fd
+    # on every call which cannot be closed without closing LMDB's handle.
+    fd = os.open(data_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, size, os.POSIX_FADV_WILLNEED)
+        offset = 0
+        while offset < size:
+            n = min(chunk_size, size - offset)
+            if hasattr(os, "pread"):
+                data = os.pread(fd, n, offset)
+            else:
+                os.lseek(fd, offset, os.SEEK_SET)
+                data = os.read(fd, n)
+            if not data:
+                break
+            offset += len(data)
+            if progress is not None:
+                progress(offset, size)
+    finally:
+        os.close(fd)
+
 
 class Database:
     def __init__(
@@ -15,46 +63,223 @@ class Database:
         max_readers: int = 126,
         max_dbs: int = 0,
         flags: Optional[LmdbEnvFlags] = None,
+        indexes: Optional[Dict[str, _IndexFn]] = None,
+        name: Optional[str] = None,
     ):
         if flags is None:
             flags = LmdbEnvFlags()
+        if indexes is None:
+            indexes = {}
         if not flags.no_subdir and not os.path.exists(path):
             os.makedirs(path)
+        max_dbs += len(indexes) + (name is not None)
         self.env = LmdbEnvironment(path, map_size, max_readers, max_dbs, *flags)
-        with LmdbTransaction(self.env, read_only=flags.read_only) as txn:
-            self.dbi = LmdbDatabase(txn)
+        self._open_dbis(indexes, name)
+
+    def __getstate__(self) -> _DatabaseState:
+        return self.env, self.indexes, self.name
+
+    def __setstate__(self, state: _DatabaseState):
+        self.env, indexes, name = state
+        self._open_dbis(indexes, name)
+
+    def _open_dbis(self, indexes: Dict[str, _IndexFn], name: Optional[str]) -> None:
+        self.indexes = indexes
+        self.name = name
+        self.index_dbis: Dict[str, LmdbDatabase] = {}
+        self._index_db_names = {(_INDEX_DB_PREFIX + i).encode() for i in indexes}
+        self._max_key_size = self.env.get_max_key_size()
+        read_only = self.env.get_flags().read_only
+        with LmdbTransaction(self.env, read_only=read_only) as txn:
+            # records are stored in the main database, or in a named sub-database
+            self.dbi = LmdbDatabase(
+                txn, name=name, create=name is not None and not read_only
+            )
+            for index in indexes:
+                try:
+                    self.index_dbis[index] = LmdbDatabase(
+                        txn, name=_INDEX_DB_PREFIX + index, duplicate_sort=True
+                    )
+                except LmdbException as e:
+                    if e.rc != MDB_NOTFOUND or read_only:
+                        raise
+                    # a new index on existing records is filled in the same txn
+                    self.index_dbis[index] = LmdbDatabase(
+                        txn,
+                        name=_INDEX_DB_PREFIX + index,
+                        duplicate_sort=True,
+                        create=True,
+                    )
+                    self._rebuild_index(index, txn)
 
-    def __getstate__(self) -> LmdbEnvironment:
-        return self.env
+    def _index_key(self, name: str, value: bytes) -> Optional[bytes]:
+        index_key = self.indexes[name](value)
+        if index_key is not None and not 0 < len(index_key) <= self._max_key_size:
+            raise ValueError(
+                f"Index {name!r} returned a key of length {len(index_key)}. "
+                f"It must be between 1 and {self._max_key_size} bytes"
+            )
+        return index_key
 
-    def __setstate__(self, state: LmdbEnvironment):
-        self.env = state
-        with LmdbTransaction(self.env, read_only=self.env.get_flags().read_only) as txn:
-            self.dbi = LmdbDatabase(txn)
+    def _delete_index_entry(
+        self, index: str, index_key: bytes, key: bytes, txn: LmdbTransaction
+    ) -> None:
+        try:
+            self.index_dbis[index].delete(index_key, txn, key)
+        except LmdbException as e:
+            # a missing entry is already in sync with the record
+            if e.rc != MDB_NOTFOUND:
+                raise
+
+    # keep index entries in sync within the same write transaction.
+    # all index keys are computed and checked before anything is written
+    def _put(self, key: bytes, value: bytes, txn: LmdbTransaction) -> None:
+        if self.indexes:
+            if key in self._index_db_names:
+                raise ValueError(f"Key {key!r} is reserved for an index sub-database")
+            # primary keys are stored as duplicate data, which has the same size limit
+            if len(key) > self._max_key_size:
+                raise ValueError(
+                    f"Keys of an indexed Database must be at most "
+                    f"{self._max_key_size} bytes"
+                )
+            old_value = self.dbi.get(key, txn, None)
+            updates = []
+            for name in self.indexes:
+                old_index_key = None
+                if old_value is not None:
+                    old_index_key = self._index_key(name, old_value)
+                new_index_key = self._index_key(name, value)
+                if old_index_key != new_index_key:
+                    updates.append((name, old_index_key, new_index_key))
+            for name, old_index_key, new_index_key in updates:
+                if old_index_key is not None:
+                    self._delete_index_entry(name, old_index_key, key, txn)
+                if new_index_key is not None:
+                    self.index_dbis[name].put(new_index_key, key, txn)
+        self.dbi.put(key, value, txn)
+
+    def _delete(self, key: bytes, txn: LmdbTransaction) -> None:
+        if self.indexes:
+            old_value = self.dbi.get(key, txn)
+            index_keys = [self._index_key(name, old_value) for name in self.indexes]
+            for name, index_key in zip(self.indexes, index_keys):
+                if index_key is not None:
+                    self._delete_index_entry(name, index_key, key, txn)
+        self.dbi.delete(key, txn)
+
+    def warm_up(
+        self,
+        background: bool = False,
+        progress: Optional[Callable[[int, int], None]] = None,
+        chunk_size: int = _WARM_UP_CHUNK_SIZE,
+    ) -> Optional[threading.Thread]:
+        # the whole used part of the file is read. warming only the branch pages would
+        # mean walking the tree from the root page, whose number and page layout are
+        # internal to LMDB and not exposed by its public API.
+        size = (self.env.get_info().me_last_pgno + 1) * self.env.get_stat().ms_psize
+        data_path = self.env.get_path()
+        if not self.env.get_flags().no_subdir:
+            data_path = os.path.join(data_path, "data.mdb")
+        args = (data_path, size, chunk_size, progress)
+        if not background:
+            _read_into_page_cache(*args)
+            return None
+        thread = threading.Thread(target=_read_into_page_cache, args=args, daemon=True)
+        thread.start()
+        return thread
+
+    def advise(
+        self,
+        random: bool = False,
+        sequential: bool = False,
+        will_need: bool = False,
+    ) -> None:
+        self.env.advise(random, sequential, will_need)
 
-    def get(self, key: bytes) -> bytes:
+    def get(self, key: bytes, default: Any = _MISSING) -> Any:
         with LmdbTransaction(self.env, read_only=True) as txn:
-            return self.dbi.get(key, txn)
+            return self.dbi.get(key, txn, default)
+
+    def exists(self, key: bytes) -> bool:
+        with LmdbTransaction(self.env, read_only=True) as txn:
+            return self.dbi.exists(key, txn)
+
+    def __contains__(self, key: bytes) -> bool:
+        return self.exists(key)
 
     def put(self, key: bytes, value: bytes) -> None:
         with LmdbTransaction(self.env) as txn:
-            self.dbi.put(key, value, txn)
+            self._put(key, value, txn)
 
     def delete(self, key: bytes) -> None:
         with LmdbTransaction(self.env) as txn:
-            self.dbi.delete(key, txn)
+            self._delete(key, txn)
 
     def get_batch(self, keys: Iterable[bytes]) -> Generator[bytes, None, None]:
         with LmdbTransaction(self.env, read_only=True) as txn:
             for k in keys:
                 yield self.dbi.get(k, txn)
 
+    def exists_many(self, keys: Iterable[bytes]) -> List[bool]:
+        with LmdbTransaction(self.env, read_only=True) as txn:
+            return self.dbi.exists_many(keys, txn)
+
     def put_batch(self, kv_pairs: Iterable[Tuple[bytes, bytes]]) -> None:
         with LmdbTransaction(self.env) as txn:
             for k, v in kv_pairs:
-                self.dbi.put(k, v, txn)
+                self._put(k, v, txn)
 
     def delete_batch(self, keys: Iterable[bytes]) -> None:
         with LmdbTransaction(self.env) as txn:
             for k in keys:
-                self.dbi.delete(k, txn)
+                self._delete(k, txn)
+
+    def lookup_by(self, index: str, value: bytes) -> List[bytes]:
+        # no index key outside of this range can be stored
+        if not 0 < len(value) <= self._max_key_size:
+            return []
+        keys = []
+        with LmdbTransaction(self.env, read_only=True) as txn:
+            with LmdbCursor(self.index_dbis[index], txn) as cursor:
+                found = cursor.set_key(value)
+                while found:
+                    keys.append(cursor.value())
+                    found = cursor.next_dup()
+        return keys
+
+    # yield (index key, primary key) pairs with start <= index key < stop, in order
+    def range_by(
+        self, index: str, start: Optional[bytes] = None, stop: Optional[bytes] = None
+    ) -> Generator[Tuple[bytes, bytes], None, None]:
+        with LmdbTransaction(self.env, read_only=True) as txn:
+            with LmdbCursor(self.index_dbis[index], txn) as cursor:
+                if not start:
+                    found = cursor.first()
+                else:
+                    # LMDB rejects lookup keys longer than the max key size
+                    found = cursor.set_range(start[: self._max_key_size])
+                while found:
+                    index_key = cursor.key()
+                    if stop is not None and index_key >= stop:
+                        break
+                    if start is None or index_key >= start:
+                        yield index_key, cursor.value()
+                    found = cursor.next()
+
+    def rebuild_index(self, index: str) -> None:
+        with LmdbTransaction(self.env) as txn:
+            self._rebuild_index(index, txn)
+
+    def _rebuild_index(self, index: str, txn: LmdbTransaction) -> None:
+        index_dbi = self.index_dbis[index]
+        index_dbi.empty_db(txn)
+        with LmdbCursor(self.dbi, txn) as cursor:
+            found = cursor.first()
+            while found:
+                # the main database also holds the records of named sub-databases
+                if not cursor.is_sub_database():
+                    index_key = self._index_key(index, cursor.value())
+                    if index_key is not None:
+                        index_dbi.put(index_key, cursor.key(), txn)
+                found = cursor.next()
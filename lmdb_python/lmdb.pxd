@@ -60,7 +60,25 @@ cdef extern from "lmdb.h":
 
     # Cursor Get operations
     ctypedef enum MDB_cursor_op:
-        pass
+        MDB_FIRST
+        MDB_FIRST_DUP
+        MDB_GET_BOTH
+        MDB_GET_BOTH_RANGE
+        MDB_GET_CURRENT
+        MDB_GET_MULTIPLE
+        MDB_LAST
+        MDB_LAST_DUP
+        MDB_NEXT
+        MDB_NEXT_DUP
+        MDB_NEXT_MULTIPLE
+        MDB_NEXT_NODUP
+        MDB_PREV
+        MDB_PREV_DUP
+        MDB_PREV_NODUP
+        MDB_SET
+        MDB_SET_KEY
+        MDB_SET_RANGE
+        MDB_PREV_MULTIPLE
     
     # Return Codes
     cdef int MDB_SUCCESS
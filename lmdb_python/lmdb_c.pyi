@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Iterable, List, Optional, Union
 
 from .types import LmdbDbFlags, LmdbEnvFlags, LmdbEnvInfo, LmdbStat
 
@@ -27,6 +27,8 @@ MDB_BAD_TXN: int
 MDB_BAD_VALSIZE: int
 MDB_BAD_DBI: int
 
+_MISSING: object
+
 def version() -> str: ...
 def strerror(err: int) -> str: ...
 
@@ -78,6 +80,12 @@ class LmdbEnvironment:
     def get_flags(self) -> LmdbEnvFlags: ...
     def get_path(self) -> str: ...
     def get_fd(self) -> int: ...
+    def advise(
+        self,
+        random: bool = False,
+        sequential: bool = False,
+        will_need: bool = False,
+    ) -> None: ...
     def set_map_size(self, size: int) -> None: ...
     def get_max_readers(self) -> int: ...
     def get_max_key_size(self) -> int: ...
@@ -109,11 +117,16 @@ class LmdbDatabase:
     def get_flags(self, txn: LmdbTransaction) -> LmdbDbFlags: ...
     def empty_db(self, txn: LmdbTransaction) -> None: ...
     def delete_db(self, txn: LmdbTransaction) -> None: ...
-    def get(self, key: bytes, txn: LmdbTransaction) -> bytes: ...
+    def get(self, key: bytes, txn: LmdbTransaction, default: Any = ...) -> Any: ...
+    def get_view(self, key: bytes, txn: LmdbTransaction, default: Any = ...) -> Any: ...
+    def exists(self, key: bytes, txn: LmdbTransaction) -> bool: ...
+    def exists_many(
+        self, keys: Iterable[bytes], txn: LmdbTransaction
+    ) -> List[bool]: ...
     def put(
         self,
         key: bytes,
-        value: bytes,
+        value: Union[bytes, bytearray, memoryview],
         txn: LmdbTransaction,
         no_overwrite: bool = False,
         no_duplicate: bool = False,
@@ -123,4 +136,23 @@ class LmdbDatabase:
         append_duplicate: bool = False,
         multiple: bool = False,
     ) -> None: ...
-    def delete(self, key: bytes, txn: LmdbTransaction) -> None: ...
+    def delete(
+        self, key: bytes, txn: LmdbTransaction, value: Optional[bytes] = None
+    ) -> None: ...
+
+class LmdbCursor:
+    def __init__(self, dbi: LmdbDatabase, txn: LmdbTransaction): ...
+    def first(self) -> bool: ...
+    def last(self) -> bool: ...
+    def next(self) -> bool: ...
+    def prev(self) -> bool: ...
+    def next_dup(self) -> bool: ...
+    def set_key(self, key: bytes) -> bool: ...
+    def set_range(self, key: bytes) -> bool: ...
+    def key(self) -> bytes: ...
+    def value(self) -> bytes: ...
+    def is_sub_database(self) -> bool: ...
+    def count(self) -> int: ...
+    def close(self) -> None: ...
+    def __enter__(self) -> LmdbCursor: ...
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> None: ...
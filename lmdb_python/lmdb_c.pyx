@@ -1,13 +1,23 @@
 import ctypes
 import errno
 import os
-from typing import Optional
+from typing import Iterable, List, Optional
+
+cimport cython
+from cpython.buffer cimport PyBUF_SIMPLE, PyBuffer_Release, PyObject_GetBuffer
 
 from . cimport lmdb
 IF UNAME_SYSNAME != "Linux" and UNAME_SYSNAME != "Darwin":
     from . cimport msvcrt
+ELSE:
+    from libc.errno cimport errno as c_errno
+    from posix cimport mman
 from .types import LmdbStat, LmdbEnvInfo, LmdbEnvFlags, LmdbDbFlags
 
+cdef extern from "Python.h":
+    int PyBUF_READ
+    object PyMemoryView_FromMemory(char* mem, Py_ssize_t size, int flags)
+
 # define symbols
 MDB_VERSION_MAJOR = lmdb.MDB_VERSION_MAJOR
 MDB_VERSION_MINOR = lmdb.MDB_VERSION_MINOR
@@ -80,6 +90,10 @@ def _check_rc(rc: int) -> None:
     raise LmdbException(rc=rc)
 
 
+# sentinel to distinguish "no default given" from default=None
+_MISSING = object()
+
+
 cdef class LmdbEnvironment:
     cdef lmdb.MDB_env* env
     max_dbs: int
@@ -255,6 +269,84 @@ cdef class LmdbEnvironment:
         _check_rc(rc)
         return _handle_to_fd(fd)
 
+    # mdb_env_info() only reports the map address for MDB_FIXEDMAP. instead, find the
+    # leaf page holding the first key of the main database. LMDB pages start with
+    # their page number, which gives the offset of that page from the start of the map.
+    cdef char* _get_map_address(self) except NULL:
+        cdef lmdb.MDB_envinfo envinfo
+        cdef lmdb.MDB_stat stat
+        cdef lmdb.MDB_txn* txn
+        cdef lmdb.MDB_dbi dbi
+        cdef lmdb.MDB_cursor* cursor
+        cdef lmdb.MDB_val mdb_key
+        cdef lmdb.MDB_val mdb_value
+        cdef size_t page = 0
+        cdef size_t pgno = 0
+        rc = lmdb.mdb_env_info(self.env, &envinfo)
+        _check_rc(rc)
+        rc = lmdb.mdb_env_stat(self.env, &stat)
+        _check_rc(rc)
+        rc = lmdb.mdb_txn_begin(self.env, NULL, lmdb.MDB_RDONLY, &txn)
+        _check_rc(rc)
+        rc = lmdb.mdb_dbi_open(txn, NULL, 0, &dbi)
+        if rc == 0:
+            rc = lmdb.mdb_cursor_open(txn, dbi, &cursor)
+            if rc == 0:
+                rc = lmdb.mdb_cursor_get(cursor, &mdb_key, &mdb_value, lmdb.MDB_FIRST)
+                if rc == 0:
+                    # keys are always stored inside their leaf page
+                    page = <size_t>mdb_key.mv_data
+                    page -= page % stat.ms_psize
+                    pgno = (<size_t*>page)[0]
+                lmdb.mdb_cursor_close(cursor)
+        lmdb.mdb_txn_abort(txn)
+        if rc == lmdb.MDB_NOTFOUND:
+            raise LmdbException(msg="The map address can only be found in a non-empty database")
+        _check_rc(rc)
+        if pgno < 2 or pgno > envinfo.me_last_pgno:
+            raise LmdbException(msg=f"Unexpected page number {pgno} in the page header")
+        return <char*>(page - pgno * stat.ms_psize)
+
+    # the map is located through the first record, so the database must not be empty.
+    # this opens a read transaction, so it must not be called from a thread that
+    # already holds one. set_map_size() remaps the file, so the hint must be reapplied.
+    def advise(
+        self,
+        random: bool = False,
+        sequential: bool = False,
+        will_need: bool = False,
+    ) -> None:
+        if random + sequential + will_need > 1:
+            raise ValueError("Only one of random, sequential and will_need can be set")
+        cdef lmdb.MDB_envinfo envinfo
+        cdef lmdb.MDB_stat stat
+        cdef char* map_address
+        cdef int advice
+        cdef size_t length
+        IF UNAME_SYSNAME == "Linux" or UNAME_SYSNAME == "Darwin":
+            rc = lmdb.mdb_env_info(self.env, &envinfo)
+            _check_rc(rc)
+            rc = lmdb.mdb_env_stat(self.env, &stat)
+            _check_rc(rc)
+            map_address = self._get_map_address()
+            # access-pattern hints cover the whole map (like LMDB does for MDB_NORDAHEAD)
+            # so pages the database grows into keep the hint.
+            # will_need triggers reads, so it only covers the used pages.
+            length = envinfo.me_mapsize
+            advice = mman.MADV_NORMAL
+            if random:
+                advice = mman.MADV_RANDOM
+            elif sequential:
+                advice = mman.MADV_SEQUENTIAL
+            elif will_need:
+                advice = mman.MADV_WILLNEED
+                length = (envinfo.me_last_pgno + 1) * stat.ms_psize
+            rc = mman.madvise(map_address, length, advice)
+            if rc:
+                _check_rc(c_errno)
+        ELSE:
+            raise NotImplementedError("advise() is only supported on Linux and macOS")
+
     def set_map_size(self, size: int) -> None:
         rc = lmdb.mdb_env_set_mapsize(self.env, size)
         _check_rc(rc)
@@ -316,7 +408,8 @@ cdef class LmdbTransaction:
     def __exit__(self, exc_type, exc_value, exc_traceback) -> None:
         if self.txn is NULL:
             return
-        if self.read_only:
+        # do not commit a partial write when an exception is raised
+        if self.read_only or exc_type is not None:
             self.abort()
         else:
             self.commit()
@@ -336,6 +429,11 @@ cdef bytes _mv_to_bytes(lmdb.MDB_val mdb_data):
     return (<char*>mdb_data.mv_data)[:mdb_data.mv_size]
 
 
+# zero-copy: the returned memoryview points into the map and is only valid until the txn ends
+cdef object _mv_to_memoryview(lmdb.MDB_val mdb_data):
+    return PyMemoryView_FromMemory(<char*>mdb_data.mv_data, mdb_data.mv_size, PyBUF_READ)
+
+
 cdef class LmdbDatabase:
     cdef lmdb.MDB_dbi dbi
 
@@ -407,17 +505,53 @@ cdef class LmdbDatabase:
         rc = lmdb.mdb_drop(txn.txn, self.dbi, 1)
         _check_rc(rc)
 
-    def get(self, key: bytes, txn: LmdbTransaction) -> bytes:
+    def get(self, key: bytes, txn: LmdbTransaction, default=_MISSING):
         cdef lmdb.MDB_val mdb_key = _bytes_to_mv(key)
         cdef lmdb.MDB_val mdb_value
-        rc = lmdb.mdb_get(txn.txn, self.dbi, &mdb_key, &mdb_value)
+        cdef int rc = lmdb.mdb_get(txn.txn, self.dbi, &mdb_key, &mdb_value)
+        # a miss with a default should not pay for building an exception
+        if rc == lmdb.MDB_NOTFOUND and default is not _MISSING:
+            return default
         _check_rc(rc)
         return _mv_to_bytes(mdb_value)
+
+    def get_view(self, key: bytes, txn: LmdbTransaction, default=_MISSING):
+        cdef lmdb.MDB_val mdb_key = _bytes_to_mv(key)
+        cdef lmdb.MDB_val mdb_value
+        cdef int rc = lmdb.mdb_get(txn.txn, self.dbi, &mdb_key, &mdb_value)
+        if rc == lmdb.MDB_NOTFOUND and default is not _MISSING:
+            return default
+        _check_rc(rc)
+        return _mv_to_memoryview(mdb_value)
+
+    def exists(self, key: bytes, txn: LmdbTransaction) -> bool:
+        cdef lmdb.MDB_val mdb_key = _bytes_to_mv(key)
+        cdef lmdb.MDB_val mdb_value
+        cdef int rc = lmdb.mdb_get(txn.txn, self.dbi, &mdb_key, &mdb_value)
+        if rc == lmdb.MDB_NOTFOUND:
+            return False
+        _check_rc(rc)
+        return True
+
+    def exists_many(self, keys: Iterable[bytes], txn: LmdbTransaction) -> List[bool]:
+        cdef lmdb.MDB_val mdb_key
+        cdef lmdb.MDB_val mdb_value
+        cdef int rc
+        results = []
+        for key in keys:
+            mdb_key = _bytes_to_mv(key)
+            rc = lmdb.mdb_get(txn.txn, self.dbi, &mdb_key, &mdb_value)
+            if rc == lmdb.MDB_NOTFOUND:
+                results.append(False)
+            else:
+                _check_rc(rc)
+                results.append(True)
+        return results
     
     def put(
         self,
         key: bytes,
-        value: bytes,
+        value,
         txn: LmdbTransaction,
         no_overwrite: bool = False,
         no_duplicate: bool = False,
@@ -428,7 +562,8 @@ cdef class LmdbDatabase:
         multiple: bool = False,
     ) -> None:
         cdef lmdb.MDB_val mdb_key = _bytes_to_mv(key)
-        cdef lmdb.MDB_val mdb_value = _bytes_to_mv(value)
+        cdef lmdb.MDB_val mdb_value
+        cdef Py_buffer value_buf
         cdef unsigned int flags = 0
         if no_overwrite:
             flags |= lmdb.MDB_NOOVERWRITE
@@ -444,10 +579,134 @@ cdef class LmdbDatabase:
             flags |= lmdb.MDB_APPENDDUP
         if multiple:
             flags |= lmdb.MDB_MULTIPLE
-        rc = lmdb.mdb_put(txn.txn, self.dbi, &mdb_key, &mdb_value, flags)
+        if isinstance(value, bytes):
+            mdb_value = _bytes_to_mv(value)
+            rc = lmdb.mdb_put(txn.txn, self.dbi, &mdb_key, &mdb_value, flags)
+        else:
+            # any C-contiguous buffer (bytearray, memoryview, numpy array) is written without a copy
+            PyObject_GetBuffer(value, &value_buf, PyBUF_SIMPLE)
+            mdb_value.mv_size = value_buf.len
+            mdb_value.mv_data = value_buf.buf
+            try:
+                rc = lmdb.mdb_put(txn.txn, self.dbi, &mdb_key, &mdb_value, flags)
+            finally:
+                PyBuffer_Release(&value_buf)
         _check_rc(rc)
 
-    def delete(self, key: bytes, txn: LmdbTransaction) -> None:
+    def delete(self, key: bytes, txn: LmdbTransaction, value: Optional[bytes] = None) -> None:
         cdef lmdb.MDB_val mdb_key = _bytes_to_mv(key)
-        rc = lmdb.mdb_del(txn.txn, self.dbi, &mdb_key, NULL)
+        cdef lmdb.MDB_val mdb_value
+        # with duplicate_sort, passing value only deletes that data item
+        if value is None:
+            rc = lmdb.mdb_del(txn.txn, self.dbi, &mdb_key, NULL)
+        else:
+            mdb_value = _bytes_to_mv(value)
+            rc = lmdb.mdb_del(txn.txn, self.dbi, &mdb_key, &mdb_value)
         _check_rc(rc)
+
+
+# keep self.txn alive in __dealloc__ so close() can check the transaction state
+@cython.no_gc_clear
+cdef class LmdbCursor:
+    cdef lmdb.MDB_cursor* cursor
+    cdef LmdbTransaction txn
+    cdef lmdb.MDB_val mdb_key
+    cdef lmdb.MDB_val mdb_value
+    cdef bint positioned
+
+    def __cinit__(self, dbi: LmdbDatabase, txn: LmdbTransaction):
+        self.txn = txn
+        self.positioned = False
+        rc = lmdb.mdb_cursor_open(txn.txn, dbi.dbi, &self.cursor)
+        _check_rc(rc)
+
+    # LMDB frees the cursors of a write transaction when the transaction ends
+    cdef int _check_valid(self) except -1:
+        if self.cursor is NULL or self.txn.txn is NULL:
+            raise LmdbException(msg="Invalid transaction")
+        return 0
+
+    cdef int _check_positioned(self) except -1:
+        self._check_valid()
+        if not self.positioned:
+            raise LmdbException(msg="Cursor is not positioned")
+        return 0
+
+    # return 0 instead of raising when the cursor runs out of items.
+    # the lookup key only lives for this call, so the position is kept only on success
+    cdef int _get(self, lmdb.MDB_cursor_op op, bytes key=None) except -1:
+        cdef lmdb.MDB_val mdb_key
+        cdef lmdb.MDB_val mdb_value
+        cdef int rc
+        self._check_valid()
+        if key is not None:
+            mdb_key = _bytes_to_mv(key)
+        self.positioned = False
+        rc = lmdb.mdb_cursor_get(self.cursor, &mdb_key, &mdb_value, op)
+        if rc == lmdb.MDB_NOTFOUND:
+            return 0
+        _check_rc(rc)
+        self.mdb_key = mdb_key
+        self.mdb_value = mdb_value
+        self.positioned = True
+        return 1
+
+    def first(self) -> bool:
+        return self._get(lmdb.MDB_FIRST) == 1
+
+    def last(self) -> bool:
+        return self._get(lmdb.MDB_LAST) == 1
+
+    def next(self) -> bool:
+        return self._get(lmdb.MDB_NEXT) == 1
+
+    def prev(self) -> bool:
+        return self._get(lmdb.MDB_PREV) == 1
+
+    def next_dup(self) -> bool:
+        return self._get(lmdb.MDB_NEXT_DUP) == 1
+
+    def set_key(self, key: bytes) -> bool:
+        return self._get(lmdb.MDB_SET_KEY, key) == 1
+
+    def set_range(self, key: bytes) -> bool:
+        return self._get(lmdb.MDB_SET_RANGE, key) == 1
+
+    def key(self) -> bytes:
+        self._check_positioned()
+        return _mv_to_bytes(self.mdb_key)
+
+    def value(self) -> bytes:
+        self._check_positioned()
+        return _mv_to_bytes(self.mdb_value)
+
+    # the main database holds a record for every named sub-database. LMDB marks these
+    # with F_SUBDATA (0x02) in the flags of the leaf node header, which ends with
+    # mn_flags and mn_ksize (2 bytes each) right before the key
+    def is_sub_database(self) -> bool:
+        self._check_positioned()
+        return ((<unsigned short*>(<char*>self.mdb_key.mv_data - 4))[0] & 0x02) != 0
+
+    def count(self) -> int:
+        cdef lmdb.size_t count
+        self._check_valid()
+        rc = lmdb.mdb_cursor_count(self.cursor, &count)
+        _check_rc(rc)
+        return count
+
+    def close(self) -> None:
+        # cursors of a write transaction are freed by LMDB when the transaction ends
+        if self.cursor is NULL or self.txn is None:
+            return
+        if self.txn.read_only or self.txn.txn is not NULL:
+            lmdb.mdb_cursor_close(self.cursor)
+        self.cursor = NULL
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> None:
+        self.close()
+
+    def __dealloc__(self):
+        self.close()
@@ -31,4 +31,5 @@ setup(
     url="https://github.com/gau-nernst/lmdb-python",
     ext_modules=cythonize([ext], compiler_directives=compiler_directives),
     packages=["lmdb_python"],
+    extras_require={"numpy": ["numpy"]},
 )
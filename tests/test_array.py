@@ -0,0 +1,130 @@
+import pickle
+from pathlib import Path
+from typing import List
+
+import pytest
+from lmdb_python import LmdbEnvFlags, lmdb_c
+
+np = pytest.importorskip("numpy")
+from lmdb_python.array import ArrayDatabase  # noqa: E402
+
+_SHAPE = (4, 8)
+
+
+@pytest.fixture
+def db(tmp_path: Path):
+    return ArrayDatabase(str(tmp_path), dtype=np.float32, shape=_SHAPE)
+
+
+@pytest.fixture
+def keys_10():
+    return [f"key_{i}".encode() for i in range(10)]
+
+
+@pytest.fixture
+def arrays_10():
+    return [np.full(_SHAPE, i, dtype=np.float32) for i in range(10)]
+
+
+@pytest.fixture
+def db_with_data_10(db: ArrayDatabase, keys_10: List[bytes], arrays_10):
+    db.put_batch(zip(keys_10, arrays_10))
+    return db
+
+
+def test_create_db_no_dtype_exception(tmp_path: Path):
+    with pytest.raises(ValueError):
+        ArrayDatabase(str(tmp_path))
+
+
+def test_put_get(db: ArrayDatabase):
+    array = np.arange(32, dtype=np.float32).reshape(_SHAPE)
+    db.put(b"key", array)
+    result = db.get(b"key")
+    assert result.dtype == np.float32
+    np.testing.assert_array_equal(result, array)
+
+
+def test_put_wrong_shape_exception(db: ArrayDatabase):
+    with pytest.raises(ValueError):
+        db.put(b"key", np.zeros((2, 2), dtype=np.float32))
+
+
+@pytest.mark.parametrize("dtype", (np.float64, np.int32))
+def test_put_wrong_dtype_exception(db: ArrayDatabase, dtype):
+    with pytest.raises(ValueError):
+        db.put(b"key", np.zeros(_SHAPE, dtype=dtype))
+
+
+def test_get_default(db_with_data_10: ArrayDatabase, keys_10: List[bytes], arrays_10):
+    np.testing.assert_array_equal(db_with_data_10.get(keys_10[0], None), arrays_10[0])
+    assert db_with_data_10.get(b"missing", None) is None
+    with lmdb_c.LmdbTransaction(db_with_data_10.env, read_only=True) as txn:
+        assert db_with_data_10.get(b"missing", None, txn=txn) is None
+    with pytest.raises(lmdb_c.LmdbException) as e:
+        db_with_data_10.get(b"missing")
+    assert e.value.rc == lmdb_c.MDB_NOTFOUND
+
+
+def test_exists(db_with_data_10: ArrayDatabase, keys_10: List[bytes]):
+    assert keys_10[0] in db_with_data_10
+    assert b"missing" not in db_with_data_10
+
+
+def test_put_batch_failure_is_atomic(db: ArrayDatabase):
+    with pytest.raises(ValueError):
+        db.put_batch(
+            [(b"a", np.zeros(_SHAPE, dtype=np.float32)), (b"b", np.zeros((2, 2)))]
+        )
+    assert not db.exists(b"a")
+
+
+def test_put_non_contiguous(db: ArrayDatabase):
+    array = np.arange(32, dtype=np.float32).reshape(8, 4).T
+    db.put(b"key", array)
+    np.testing.assert_array_equal(db.get(b"key"), array)
+
+
+def test_get_view(db_with_data_10: ArrayDatabase, keys_10: List[bytes], arrays_10):
+    with lmdb_c.LmdbTransaction(db_with_data_10.env, read_only=True) as txn:
+        view = db_with_data_10.get(keys_10[3], txn=txn)
+        assert not view.flags.writeable
+        np.testing.assert_array_equal(view, arrays_10[3])
+
+
+def test_get_batch(db_with_data_10: ArrayDatabase, keys_10: List[bytes], arrays_10):
+    for a1, a2 in zip(db_with_data_10.get_batch(keys_10), arrays_10):
+        np.testing.assert_array_equal(a1, a2)
+
+
+def test_get_stack(db_with_data_10: ArrayDatabase, keys_10: List[bytes], arrays_10):
+    stack = db_with_data_10.get_stack(keys_10)
+    assert stack.shape == (10, *_SHAPE)
+    np.testing.assert_array_equal(stack, np.stack(arrays_10))
+
+    out = np.empty_like(stack)
+    assert db_with_data_10.get_stack(keys_10, out=out) is out
+    np.testing.assert_array_equal(out, stack)
+
+
+def test_reopen_metadata(tmp_path: Path, db_with_data_10: ArrayDatabase):
+    db_with_data_10.env.close()
+    flags = LmdbEnvFlags(read_only=True)
+    db = ArrayDatabase(str(tmp_path), flags=flags)
+    assert db.dtype == np.float32
+    assert db.shape == _SHAPE
+    db.env.close()
+
+    with pytest.raises(ValueError):
+        ArrayDatabase(str(tmp_path), dtype=np.int64, flags=flags)
+
+
+def test_read_only_no_table_exception(tmp_path: Path):
+    lmdb_c.LmdbEnvironment(str(tmp_path)).close()
+    with pytest.raises(ValueError, match="does not exist"):
+        ArrayDatabase(str(tmp_path), flags=LmdbEnvFlags(read_only=True))
+
+
+def test_pickle(db_with_data_10: ArrayDatabase, keys_10: List[bytes], arrays_10):
+    db = pickle.loads(pickle.dumps(db_with_data_10))
+    np.testing.assert_array_equal(db.get(keys_10[0]), arrays_10[0])
@@ -1,9 +1,11 @@
 import os
 import pickle
+import re
+import sys
 import threading
 import time
 from pathlib import Path
-from typing import Callable, Iterable, Tuple
+from typing import Callable, Iterable, List, Set, Tuple
 
 import lmdb_python.types
 import pytest
@@ -116,6 +118,58 @@ def test_env_get_fd(lmdb_env: lmdb_c.LmdbEnvironment):
     # TODO: try to do something with the file obbject
 
 
+def _get_vm_flags(path: str) -> List[Set[str]]:
+    # VmFlags of every mapping of path: "rr" is MADV_RANDOM, "sr" is MADV_SEQUENTIAL
+    vm_flags = []
+    is_path = False
+    with open("/proc/self/smaps") as f:
+        for line in f:
+            if re.match(r"^[0-9a-f]+-[0-9a-f]+ ", line):
+                is_path = line.rstrip().endswith(path)
+            elif is_path and line.startswith("VmFlags:"):
+                vm_flags.append(set(line.split()[1:]))
+    return vm_flags
+
+
+@pytest.mark.skipif(os.name == "nt", reason="madvise() is not available on Windows")
+@pytest.mark.parametrize(
+    "kwargs,vm_flag",
+    (
+        (dict(random=True), "rr"),
+        (dict(sequential=True), "sr"),
+        ({}, None),
+        (dict(will_need=True), None),
+    ),
+)
+def test_env_advise(lmdb_env: lmdb_c.LmdbEnvironment, kwargs, vm_flag):
+    txn = lmdb_c.LmdbTransaction(lmdb_env)
+    lmdb_c.LmdbDatabase(txn).put(b"key", b"value", txn)
+    txn.commit()
+
+    lmdb_env.advise(**kwargs)
+    if not sys.platform.startswith("linux"):
+        return
+    data_path = os.path.realpath(os.path.join(lmdb_env.get_path(), "data.mdb"))
+    vm_flags = _get_vm_flags(data_path)
+    assert len(vm_flags) > 0
+    for flags in vm_flags:
+        if vm_flag is None:
+            assert "rr" not in flags and "sr" not in flags
+        else:
+            assert vm_flag in flags
+
+
+@pytest.mark.skipif(os.name == "nt", reason="madvise() is not available on Windows")
+def test_env_advise_empty_exception(lmdb_env: lmdb_c.LmdbEnvironment):
+    with pytest.raises(lmdb_c.LmdbException):
+        lmdb_env.advise(random=True)
+
+
+def test_env_advise_multiple_exception(lmdb_env: lmdb_c.LmdbEnvironment):
+    with pytest.raises(ValueError):
+        lmdb_env.advise(random=True, sequential=True)
+
+
 @pytest.mark.parametrize("map_size_mb", (10, 100, 1000))
 def test_env_set_map_size(lmdb_env: lmdb_c.LmdbEnvironment, map_size_mb: int):
     new_map_size = map_size_mb * 1024 * 1024
@@ -197,6 +251,17 @@ def make_txn(lmdb_env: lmdb_c.LmdbEnvironment):
     return _make_txn
 
 
+def test_txn_exit_exception_abort(lmdb_env: lmdb_c.LmdbEnvironment):
+    with pytest.raises(RuntimeError):
+        with lmdb_c.LmdbTransaction(lmdb_env) as txn:
+            lmdb_c.LmdbDatabase(txn).put(b"key", b"value", txn)
+            raise RuntimeError
+
+    txn = lmdb_c.LmdbTransaction(lmdb_env, read_only=True)
+    assert not lmdb_c.LmdbDatabase(txn).exists(b"key", txn)
+    txn.abort()
+
+
 def test_txn_get_id(make_txn: _MakeTxn):
     txn = make_txn(read_only=False)
     txn_id = txn.get_id()
@@ -348,6 +413,44 @@ def test_get_notfound(key: bytes, make_txn: _MakeTxn):
     txn.abort()
 
 
+@pytest.mark.parametrize("key", _key_samples)
+@pytest.mark.parametrize("default", (None, b"default"))
+def test_get_notfound_default(key: bytes, default, make_txn: _MakeTxn):
+    txn = make_txn(read_only=True)
+    dbi = lmdb_c.LmdbDatabase(txn)
+    assert dbi.get(key, txn, default) is default
+    txn.abort()
+
+
+@pytest.mark.parametrize("key,value", _key_value_samples)
+def test_get_default(
+    key: bytes, value: bytes, make_dbi_with_data: _MakeDbi, make_txn: _MakeTxn
+):
+    dbi = make_dbi_with_data([(key, value)])
+    txn = make_txn(read_only=True)
+    assert dbi.get(key, txn, None) == value
+    txn.abort()
+
+
+@pytest.mark.parametrize("key,value", _key_value_samples)
+def test_exists(
+    key: bytes, value: bytes, make_dbi_with_data: _MakeDbi, make_txn: _MakeTxn
+):
+    dbi = make_dbi_with_data([(key, value)])
+    txn = make_txn(read_only=True)
+    assert dbi.exists(key, txn)
+    assert not dbi.exists(key + b"_missing", txn)
+    txn.abort()
+
+
+def test_exists_many(make_dbi_with_data: _MakeDbi, make_txn: _MakeTxn):
+    dbi = make_dbi_with_data(_key_value_samples)
+    keys = [_key_samples[0], b"missing", _key_samples[1]]
+    txn = make_txn(read_only=True)
+    assert dbi.exists_many(keys, txn) == [True, False, True]
+    txn.abort()
+
+
 @pytest.mark.parametrize("key,value", _key_value_samples)
 def test_delete(
     key: bytes, value: bytes, make_dbi_with_data: _MakeDbi, make_txn: _MakeTxn
@@ -460,3 +563,110 @@ def test_env_copy_fd2_compact(
     original_size = os.stat(tmp_path / "data.mdb").st_size
     copied_size = os.stat(copied_path).st_size
     assert copied_size < original_size
+
+
+def _make_dupsort_dbi(env: lmdb_c.LmdbEnvironment, data: Iterable[_KeyValue]):
+    txn = lmdb_c.LmdbTransaction(env, read_only=False)
+    dbi = lmdb_c.LmdbDatabase(txn, name="dupsort", duplicate_sort=True, create=True)
+    for key, value in data:
+        dbi.put(key, value, txn)
+    txn.commit()
+    return dbi
+
+
+_dupsort_samples = ((b"a", b"1"), (b"b", b"2"), (b"b", b"1"), (b"c", b"3"))
+
+
+def test_delete_duplicate(tmp_path: Path):
+    env = lmdb_c.LmdbEnvironment(str(tmp_path), max_dbs=1)
+    dbi = _make_dupsort_dbi(env, _dupsort_samples)
+    txn = lmdb_c.LmdbTransaction(env, read_only=False)
+    dbi.delete(b"b", txn, b"1")
+    txn.commit()
+
+    txn = lmdb_c.LmdbTransaction(env, read_only=True)
+    assert dbi.get(b"b", txn) == b"2"
+    assert dbi.get_stat(txn).ms_entries == 3
+    txn.abort()
+
+
+def test_cursor_iterate(make_dbi_with_data: _MakeDbi, make_txn: _MakeTxn):
+    dbi = make_dbi_with_data(_key_value_samples)
+    txn = make_txn(read_only=True)
+    items = []
+    with lmdb_c.LmdbCursor(dbi, txn) as cursor:
+        found = cursor.first()
+        while found:
+            items.append((cursor.key(), cursor.value()))
+            found = cursor.next()
+    txn.abort()
+    assert items == sorted(_key_value_samples)
+
+
+def test_cursor_set_range(make_dbi_with_data: _MakeDbi, make_txn: _MakeTxn):
+    dbi = make_dbi_with_data([(b"a", b"1"), (b"c", b"3")])
+    txn = make_txn(read_only=True)
+    with lmdb_c.LmdbCursor(dbi, txn) as cursor:
+        assert cursor.set_range(b"b")
+        assert cursor.key() == b"c"
+        assert not cursor.set_range(b"d")
+        assert not cursor.set_key(b"b")
+    txn.abort()
+
+
+def test_cursor_not_positioned(make_dbi_with_data: _MakeDbi, make_txn: _MakeTxn):
+    dbi = make_dbi_with_data([(b"a", b"1")])
+    txn = make_txn(read_only=True)
+    with lmdb_c.LmdbCursor(dbi, txn) as cursor:
+        with pytest.raises(lmdb_c.LmdbException):
+            cursor.key()
+        assert cursor.first()
+        assert not cursor.set_range(b"z" * 50)
+        with pytest.raises(lmdb_c.LmdbException):
+            cursor.key()
+        with pytest.raises(lmdb_c.LmdbException):
+            cursor.value()
+    txn.abort()
+
+
+def test_cursor_is_sub_database(tmp_path: Path):
+    env = lmdb_c.LmdbEnvironment(str(tmp_path), max_dbs=1)
+    txn = lmdb_c.LmdbTransaction(env, read_only=False)
+    dbi = lmdb_c.LmdbDatabase(txn)
+    dbi.put(b"a", b"1", txn)
+    lmdb_c.LmdbDatabase(txn, name="b", create=True)
+    txn.commit()
+
+    txn = lmdb_c.LmdbTransaction(env, read_only=True)
+    with lmdb_c.LmdbCursor(dbi, txn) as cursor:
+        assert cursor.first() and cursor.key() == b"a"
+        assert not cursor.is_sub_database()
+        assert cursor.next() and cursor.key() == b"b"
+        assert cursor.is_sub_database()
+    txn.abort()
+
+
+def test_cursor_duplicates(tmp_path: Path):
+    env = lmdb_c.LmdbEnvironment(str(tmp_path), max_dbs=1)
+    dbi = _make_dupsort_dbi(env, _dupsort_samples)
+    txn = lmdb_c.LmdbTransaction(env, read_only=True)
+    with lmdb_c.LmdbCursor(dbi, txn) as cursor:
+        assert cursor.set_key(b"b")
+        assert cursor.count() == 2
+        values = [cursor.value()]
+        while cursor.next_dup():
+            values.append(cursor.value())
+    txn.abort()
+    assert values == [b"1", b"2"]
+
+
+def test_cursor_close_after_commit(make_txn: _MakeTxn):
+    txn = make_txn(read_only=False)
+    dbi = lmdb_c.LmdbDatabase(txn)
+    cursor = lmdb_c.LmdbCursor(dbi, txn)
+    txn.commit()
+    with pytest.raises(lmdb_c.LmdbException):
+        cursor.first()
+    with pytest.raises(lmdb_c.LmdbException):
+        cursor.count()
+    cursor.close()
@@ -1,4 +1,5 @@
 import concurrent.futures
+import os
 from pathlib import Path
 from typing import List
 
@@ -29,6 +30,19 @@ def test_get(db_with_data: Database):
     assert db_with_data.get(b"key") == b"value"
 
 
+def test_get_default(db_with_data: Database):
+    assert db_with_data.get(b"key", None) == b"value"
+    assert db_with_data.get(b"missing", None) is None
+    assert db_with_data.get(b"missing", b"default") == b"default"
+
+
+def test_contains(db_with_data: Database):
+    assert b"key" in db_with_data
+    assert b"missing" not in db_with_data
+    assert db_with_data.exists(b"key")
+    assert not db_with_data.exists(b"missing")
+
+
 def test_delete(db_with_data: Database):
     db_with_data.delete(b"key")
     with pytest.raises(lmdb_c.LmdbException) as e:
@@ -64,6 +78,11 @@ def test_get_batch(
         assert v1 == v2
 
 
+def test_exists_many(db_with_data_100: Database, keys_100: List[bytes]):
+    keys = keys_100 + [b"missing"]
+    assert db_with_data_100.exists_many(keys) == [True] * len(keys_100) + [False]
+
+
 def test_delete_batch(db_with_data_100: Database, keys_100: List[bytes]):
     db_with_data_100.delete_batch(keys_100)
     for k in keys_100:
@@ -72,6 +91,42 @@ def test_delete_batch(db_with_data_100: Database, keys_100: List[bytes]):
         assert e.value.rc == lmdb_c.MDB_NOTFOUND
 
 
+@pytest.mark.parametrize("background", (False, True))
+def test_warm_up(db_with_data_100: Database, background: bool):
+    progress = []
+    thread = db_with_data_100.warm_up(
+        background=background,
+        progress=lambda done, total: progress.append((done, total)),
+        chunk_size=4096,
+    )
+    if background:
+        thread.join()
+    else:
+        assert thread is None
+    assert len(progress) > 0
+    done, total = progress[-1]
+    assert done == total
+
+
+def test_warm_up_no_subdir(tmp_path: Path):
+    db = Database(str(tmp_path / "test_lmdb"), flags=LmdbEnvFlags(no_subdir=True))
+    db.put(b"key", b"value")
+    db.warm_up()
+
+
+@pytest.mark.skipif(os.name == "nt", reason="madvise() is not available on Windows")
+def test_advise(db_with_data: Database):
+    db_with_data.advise(random=True)
+    db_with_data.put(b"key2", b"value2")
+    db_with_data.advise(will_need=True)
+
+
+@pytest.mark.skipif(os.name != "nt", reason="advise() is supported")
+def test_advise_not_implemented(db: Database):
+    with pytest.raises(NotImplementedError):
+        db.advise(random=True)
+
+
 def test_get_multithreading(
     tmp_path: Path, db_with_data_100: Database, keys_100: List[bytes]
 ):
@@ -97,3 +152,123 @@ def test_get_multiprocessing(db_with_data_100: Database, keys_100: List[bytes]):
         results = executor.map(db_with_data_100.get, keys_100)
         for _ in results:
             pass
+
+
+def _email_index(value: bytes) -> bytes:
+    return value.split(b",")[0]
+
+
+_users = (
+    (b"user_1", b"b@x.com,Bob"),
+    (b"user_2", b"a@x.com,Alice"),
+    (b"user_3", b"c@x.com,Carol"),
+    (b"user_4", b"a@x.com,Alice2"),
+)
+
+
+@pytest.fixture
+def db_with_index(tmp_path: Path):
+    db = Database(str(tmp_path), indexes={"email": _email_index})
+    db.put_batch(_users)
+    return db
+
+
+def test_lookup_by(db_with_index: Database):
+    assert db_with_index.lookup_by("email", b"b@x.com") == [b"user_1"]
+    assert db_with_index.lookup_by("email", b"a@x.com") == [b"user_2", b"user_4"]
+    assert db_with_index.lookup_by("email", b"missing") == []
+
+
+def test_range_by(db_with_index: Database):
+    items = list(db_with_index.range_by("email"))
+    assert [k for k, _ in items] == [b"a@x.com", b"a@x.com", b"b@x.com", b"c@x.com"]
+    items = list(db_with_index.range_by("email", b"a@x.com", b"c@x.com"))
+    assert [v for _, v in items] == [b"user_2", b"user_4", b"user_1"]
+
+
+def test_index_update(db_with_index: Database):
+    db_with_index.put(b"user_1", b"d@x.com,Bob")
+    assert db_with_index.lookup_by("email", b"b@x.com") == []
+    assert db_with_index.lookup_by("email", b"d@x.com") == [b"user_1"]
+
+
+def test_index_delete(db_with_index: Database):
+    db_with_index.delete(b"user_2")
+    assert db_with_index.lookup_by("email", b"a@x.com") == [b"user_4"]
+    db_with_index.delete_batch([b"user_1", b"user_4"])
+    assert list(db_with_index.range_by("email")) == [(b"c@x.com", b"user_3")]
+
+
+def _failing_index(value: bytes) -> bytes:
+    if value.startswith(b"fail"):
+        raise RuntimeError("index function failed")
+    return value
+
+
+@pytest.mark.parametrize("bad_value", (b",Bob", b"fail,Bob"))
+def test_index_put_failure_is_atomic(tmp_path: Path, bad_value: bytes):
+    indexes = {"email": _email_index, "other": _failing_index}
+    db = Database(str(tmp_path), indexes=indexes)
+    db.put(b"user_1", b"b@x.com,Bob")
+
+    with pytest.raises((ValueError, RuntimeError)):
+        db.put(b"user_1", bad_value)
+    assert db.get(b"user_1") == b"b@x.com,Bob"
+    assert db.lookup_by("email", b"b@x.com") == [b"user_1"]
+    assert db.lookup_by("other", b"b@x.com,Bob") == [b"user_1"]
+
+
+def test_index_put_batch_failure_is_atomic(db_with_index: Database):
+    with pytest.raises(ValueError):
+        db_with_index.put_batch([(b"user_5", b"e@x.com,Eve"), (b"user_1", b",Bob")])
+    assert not db_with_index.exists(b"user_5")
+    assert db_with_index.lookup_by("email", b"e@x.com") == []
+    assert db_with_index.lookup_by("email", b"b@x.com") == [b"user_1"]
+
+
+def test_index_reserved_key_exception(db_with_index: Database):
+    with pytest.raises(ValueError):
+        db_with_index.put(b"__index__.email", b"x@x.com,X")
+
+
+def test_index_max_dbs(tmp_path: Path):
+    db = Database(str(tmp_path), max_dbs=1, indexes={"email": _email_index})
+    with lmdb_c.LmdbTransaction(db.env) as txn:
+        lmdb_c.LmdbDatabase(txn, name="own", create=True)
+
+    # records of named sub-databases in the main database are not indexed
+    db.put_batch(_users)
+    db.rebuild_index("email")
+    assert [v for _, v in db.range_by("email")] == [
+        b"user_2",
+        b"user_4",
+        b"user_1",
+        b"user_3",
+    ]
+
+
+def test_lookup_by_invalid_length(db_with_index: Database):
+    assert db_with_index.lookup_by("email", b"") == []
+    assert db_with_index.lookup_by("email", b"a" * 1000) == []
+    assert list(db_with_index.range_by("email", b"z" * 1000)) == []
+
+
+def test_new_index_is_built(tmp_path: Path):
+    db = Database(str(tmp_path), max_dbs=1)
+    db.put_batch(_users)
+    db.env.close()
+
+    db = Database(str(tmp_path), indexes={"email": _email_index})
+    assert db.lookup_by("email", b"b@x.com") == [b"user_1"]
+
+
+def test_index_missing_entry(db_with_index: Database):
+    # e.g. an index that went out of sync. writes must still succeed
+    with lmdb_c.LmdbTransaction(db_with_index.env) as txn:
+        db_with_index.index_dbis["email"].empty_db(txn)
+    db_with_index.put(b"user_1", b"d@x.com,Bob")
+    db_with_index.delete(b"user_2")
+    assert db_with_index.lookup_by("email", b"d@x.com") == [b"user_1"]
+
+    db_with_index.rebuild_index("email")
+    assert db_with_index.lookup_by("email", b"a@x.com") == [b"user_4"]